@@ -1,15 +1,17 @@
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from calculations import (
     compute_relative_returns,
     compute_rolling_correlations,
     compute_ytd_returns,
 )
-from config import list_configs, load_config
+from config import DashboardConfig, list_configs, load_config
 from data import fetch_hourly_data, fetch_price_data, get_base_prices, get_data_start_date
 from display import render_benchmark_header, render_dat_table, render_price_chart
 
@@ -27,17 +29,23 @@ CUSTOM_CSS = """
     }
 
     /* Metric cards */
-    [data-testid="stMetric"] {
+    .metric-row {
+        display: flex;
+        gap: 1rem;
+        margin-bottom: 1rem;
+    }
+    .metric-card {
+        flex: 1;
         background-color: #F6F8FA;
         border: 1px solid #D0D7DE;
         border-radius: 8px;
         padding: 16px 20px;
     }
-    [data-testid="stMetricValue"] {
+    .metric-value {
         font-size: 1.8rem;
         font-weight: 600;
     }
-    [data-testid="stMetricLabel"] {
+    .metric-label {
         font-size: 0.85rem;
         color: #656D76;
         text-transform: uppercase;
@@ -64,69 +72,126 @@ st.title("DAT Dashboard")
 loaded_configs = [(name.replace(" DAT Dashboard", ""), load_config(path)) for name, path in configs]
 
 
+def _executor(max_workers: int) -> ThreadPoolExecutor:
+    """Thread pool whose workers share this script run's context.
+
+    Lets cached fetches run off the main thread without Streamlit warning
+    about a missing context. Workers must not write elements: they would all
+    move the same container cursor at once, so spinners stay on the caller.
+    """
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx()),
+    )
+
+
 def _logo_data_uri(logo_path: str) -> str:
     data = Path(logo_path).read_bytes()
     b64 = base64.b64encode(data).decode()
     return f"data:image/png;base64,{b64}"
 
 
-tab_names = [f"![logo]({_logo_data_uri(c.logo)}) {name}" for name, c in loaded_configs]
-tabs = st.tabs(tab_names)
+@st.cache_data(ttl=300, max_entries=16, show_spinner=False)
+def _rolling_correlations(
+    close_df: pd.DataFrame, benchmark: str, tickers: list[str], window: int
+) -> pd.DataFrame:
+    """compute_rolling_correlations, cached across reruns.
 
-for tab, (_, config) in zip(tabs, loaded_configs):
-    with tab:
+    Cached here rather than in calculations.py so the maths stays free of
+    Streamlit. The TTL matches the price fetchers, so each refetch's frame
+    ages out instead of piling up for the life of the process.
+    """
+    return compute_rolling_correlations(close_df, benchmark, tickers, window)
 
-        # --- Fetch data ---
-        daily_start = get_data_start_date(config.ytd_base_date, config.correlation_window)
-        close_df, _ = fetch_price_data(config.all_tickers, daily_start)
 
-        hourly_start = config.ytd_base_date.isoformat()
-        hourly_df, hourly_ts = fetch_hourly_data(config.all_tickers, hourly_start)
+@st.fragment
+def _render_dashboard(config: DashboardConfig) -> None:
+    """Render one dashboard tab. As a fragment, its widgets rerun only this tab.
 
-        if close_df.empty:
-            st.error("Failed to fetch market data from Yahoo Finance. Please try again later.")
-            continue
+    The data is fetched in here rather than passed in: a fragment rerun reuses
+    the arguments from the last full run, so prices passed as arguments would
+    never refresh. After the prefetch below these calls are cache hits, and
+    once the TTL lapses a widget click picks up fresh data.
+    """
+    with st.spinner("Fetching market data..."):
+        close_df, _ = fetch_price_data(
+            config.all_tickers, get_data_start_date(config.ytd_base_date, config.correlation_window)
+        )
+        hourly_df, hourly_ts = fetch_hourly_data(
+            config.all_tickers, config.ytd_base_date.isoformat()
+        )
 
-        st.caption(f"Last updated: {hourly_ts:%Y-%m-%d %H:%M:%S} ET")
+    if close_df.empty:
+        st.error("Failed to fetch market data from Yahoo Finance. Please try again later.")
+        return
+
+    st.caption(f"Last updated: {hourly_ts:%Y-%m-%d %H:%M:%S} ET")
+
+    # --- Compute ---
+    base_prices = get_base_prices(close_df, config.ytd_base_date)
+
+    if not hourly_df.empty:
+        current_prices = hourly_df.ffill().iloc[-1]
+    else:
+        current_prices = close_df.ffill().iloc[-1]
+
+    ytd_returns = compute_ytd_returns(current_prices, base_prices)
+    relative_returns = compute_relative_returns(ytd_returns, config.benchmark)
+    corr_df = _rolling_correlations(
+        close_df, config.benchmark, list(config.tickers), config.correlation_window
+    )
+
+    # --- Render ---
+    render_benchmark_header(config.benchmark, base_prices, current_prices, ytd_returns)
+    st.divider()
+
+    col_left, col_right = st.columns([5, 6])
+
+    with col_left:
+        render_dat_table(
+            list(config.tickers),
+            config.benchmark,
+            base_prices,
+            current_prices,
+            ytd_returns,
+            relative_returns,
+            corr_df,
+            config.correlation_window,
+        )
 
-        # --- Compute ---
-        base_prices = get_base_prices(close_df, config.ytd_base_date)
+    with col_right:
+        chart_df = hourly_df if not hourly_df.empty else close_df
+        render_price_chart(
+            chart_df,
+            config.benchmark,
+            list(config.tickers),
+            pd.Timestamp(config.ytd_base_date),
+            key=config.benchmark,
+        )
 
-        if not hourly_df.empty:
-            current_prices = hourly_df.ffill().iloc[-1]
-        else:
-            current_prices = close_df.ffill().iloc[-1]
 
-        ytd_returns = compute_ytd_returns(current_prices, base_prices)
-        relative_returns = compute_relative_returns(ytd_returns, config.benchmark)
-        corr_df = compute_rolling_correlations(
-            close_df, config.benchmark, list(config.tickers), config.correlation_window
+# --- Warm the fetch caches for every dashboard up front, all in parallel ---
+# The fetchers don't draw their own spinners; one spinner on the main thread
+# covers the whole batch.
+with st.spinner("Fetching market data..."), _executor(max_workers=2 * len(loaded_configs)) as ex:
+    futures = [
+        ex.submit(
+            fetch_price_data,
+            c.all_tickers,
+            get_data_start_date(c.ytd_base_date, c.correlation_window),
         )
+        for _, c in loaded_configs
+    ] + [
+        ex.submit(fetch_hourly_data, c.all_tickers, c.ytd_base_date.isoformat())
+        for _, c in loaded_configs
+    ]
+    for f in futures:
+        f.result()
+
+tab_names = [f"![logo]({_logo_data_uri(c.logo)}) {name}" for name, c in loaded_configs]
+tabs = st.tabs(tab_names)
 
-        # --- Render ---
-        render_benchmark_header(config.benchmark, base_prices, current_prices, ytd_returns)
-        st.divider()
-
-        col_left, col_right = st.columns([5, 6])
-
-        with col_left:
-            render_dat_table(
-                list(config.tickers),
-                config.benchmark,
-                base_prices,
-                current_prices,
-                ytd_returns,
-                relative_returns,
-                corr_df,
-                config.correlation_window,
-            )
-
-        with col_right:
-            chart_df = hourly_df if not hourly_df.empty else close_df
-            render_price_chart(
-                chart_df,
-                config.benchmark,
-                list(config.tickers),
-                pd.Timestamp(config.ytd_base_date),
-                key=config.benchmark,
-            )
+for tab, (_, config) in zip(tabs, loaded_configs):
+    with tab:
+        _render_dashboard(config)
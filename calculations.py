@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 
@@ -35,7 +36,22 @@ def compute_rolling_correlations(
     if benchmark_ticker not in daily_returns.columns:
         return pd.DataFrame(columns=["Ticker", "Pearson Correlation"])
 
-    bench_returns = daily_returns[benchmark_ticker]
+    # Pearson over the trailing window for every ticker in one matrix product.
+    # Columns with gaps inside the window fall back to pairwise alignment below.
+    present = [t for t in dat_tickers if t in daily_returns.columns]
+    trailing = daily_returns[[benchmark_ticker] + present].iloc[-window:].to_numpy(dtype=float)
+    complete = (~np.isnan(trailing)).sum(axis=0) >= window
+    centered = trailing - trailing.mean(axis=0)
+    norms = np.sqrt((centered * centered).sum(axis=0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vectorized = (centered.T @ centered[:, 0]) / (norms * norms[0])
+    fast = {
+        t: vectorized[i + 1]
+        for i, t in enumerate(present)
+        if complete[0] and complete[i + 1]
+    }
+
+    bench_arr = daily_returns[benchmark_ticker].to_numpy(dtype=float)
     rows = []
 
     for ticker in dat_tickers:
@@ -43,20 +59,24 @@ def compute_rolling_correlations(
             rows.append({"Ticker": ticker, "Pearson Correlation": None})
             continue
 
-        ticker_returns = daily_returns[ticker]
+        if ticker in fast:
+            rows.append({"Ticker": ticker, "Pearson Correlation": float(fast[ticker])})
+            continue
+
+        ticker_arr = daily_returns[ticker].to_numpy(dtype=float)
         # Align and drop NaNs
-        aligned = pd.concat([bench_returns, ticker_returns], axis=1).dropna()
+        valid = ~(np.isnan(bench_arr) | np.isnan(ticker_arr))
 
-        if len(aligned) < window:
+        if valid.sum() < window:
             rows.append({"Ticker": ticker, "Pearson Correlation": None})
             continue
 
-        recent = aligned.iloc[-window:]
-        pearson = recent.iloc[:, 0].corr(recent.iloc[:, 1], method="pearson")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pearson = np.corrcoef(bench_arr[valid][-window:], ticker_arr[valid][-window:])[0, 1]
 
         rows.append({
             "Ticker": ticker,
-            "Pearson Correlation": pearson,
+            "Pearson Correlation": float(pearson),
         })
 
     return pd.DataFrame(rows)
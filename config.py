@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
 import json
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
 
@@ -16,20 +18,23 @@ class DashboardConfig:
     tickers: tuple[str, ...]
     ytd_base_date: date
     correlation_window: int
+    # Benchmark + DAT tickers, deduplicated, for a single yfinance call
+    all_tickers: tuple[str, ...] = field(init=False, repr=False, compare=False)
 
-    @property
-    def all_tickers(self) -> tuple[str, ...]:
-        """Benchmark + DAT tickers, deduplicated, for a single yfinance call."""
-        seen: set[str] = set()
-        result: list[str] = []
-        for t in [self.benchmark] + list(self.tickers):
-            if t not in seen:
-                seen.add(t)
-                result.append(t)
-        return tuple(result)
+    def __post_init__(self) -> None:
+        # Derived once at construction; frozen, so bypass __setattr__
+        object.__setattr__(
+            self, "all_tickers", tuple(dict.fromkeys((self.benchmark, *self.tickers)))
+        )
 
 
 def load_config(path: str | Path) -> DashboardConfig:
+    # Keyed on mtime so edits to a config are picked up without a restart
+    return _load_config_cached(str(path), Path(path).stat().st_mtime)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(path: str, mtime: float) -> DashboardConfig:
     with open(path) as f:
         raw = json.load(f)
     return DashboardConfig(
@@ -44,9 +49,11 @@ def load_config(path: str | Path) -> DashboardConfig:
 
 def list_configs() -> list[tuple[str, Path]]:
     """Return (display_name, path) for each JSON config in configs/ dir."""
-    configs = []
-    for p in sorted(CONFIGS_DIR.glob("*.json")):
-        with open(p) as f:
-            raw = json.load(f)
-        configs.append((raw["name"], p))
-    return configs
+    # One scandir pass; the mtime for the cache key comes off the entry itself
+    entries = sorted(
+        (e for e in os.scandir(CONFIGS_DIR) if e.name.endswith(".json")),
+        key=lambda e: e.name,
+    )
+    return [
+        (_load_config_cached(e.path, e.stat().st_mtime).name, Path(e.path)) for e in entries
+    ]
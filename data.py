@@ -1,17 +1,96 @@
 from __future__ import annotations
 
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
 import pandas as pd
+import pyarrow.parquet as pq
 import streamlit as st
 import yfinance as yf
+from yfinance.exceptions import YFRateLimitError
 
 PARQUET_PATH = Path(__file__).parent / "data" / "hourly_prices.parquet"
+PRICE_DTYPE = "float32"
+MAX_FETCH_WORKERS = 10
+# Cap on Yahoo requests in flight across every fetch in the process. The app
+# runs several fetches at once (daily + hourly for each dashboard), each with
+# its own pool, so the per-pool limit alone would multiply into a burst of 429s.
+MAX_CONCURRENT_REQUESTS = 8
+RATE_LIMIT_ATTEMPTS = 3
+RATE_LIMIT_BACKOFF = 1.0  # seconds, doubled after each 429
+
+logger = logging.getLogger(__name__)
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+
+def _ticker_close(
+    ticker: str, start: str | None = None, period: str | None = None, interval: str = "1d"
+) -> pd.Series:
+    """Download adjusted closes for a single ticker, named after the ticker.
+
+    Uses Ticker.history rather than yf.download, which keeps its results in
+    module-level state that every call resets, so concurrent downloads
+    (daily + hourly, several dashboards) would clobber each other.
+    Like yf.download, a failed ticker comes back as an empty series rather
+    than raising, so one bad symbol can't take down the whole fetch.
+    Rate limits (HTTP 429) are usually transient, so those back off and
+    retry a few times before giving up on the ticker.
+    """
+    hist = pd.DataFrame()
+    for attempt in range(RATE_LIMIT_ATTEMPTS):
+        try:
+            with _request_slots:
+                hist = yf.Ticker(ticker).history(
+                    start=start, period=period, interval=interval, auto_adjust=True
+                )
+            break
+        except YFRateLimitError:
+            if attempt < RATE_LIMIT_ATTEMPTS - 1:
+                time.sleep(RATE_LIMIT_BACKOFF * 2**attempt)
+            else:
+                logger.warning("Rate limited fetching %s, giving up", ticker)
+        except Exception:
+            logger.warning("Failed to fetch %s", ticker, exc_info=True)
+            break
+    if hist.empty:
+        return pd.Series(dtype=float, name=ticker)
+    close = hist["Close"].rename(ticker)
+    # Yahoo occasionally repeats the in-progress bar
+    if close.index.has_duplicates:
+        close = close[~close.index.duplicated(keep="last")]
+    # Same index convention as yf.download: tz-naive dates for daily bars,
+    # UTC timestamps for intraday bars
+    if interval[-1] in ("m", "h"):
+        close.index = close.index.tz_convert("UTC")
+    else:
+        close.index = close.index.tz_localize(None)
+    return close
+
 
+def _download_close(
+    tickers: tuple[str, ...], start: str | None = None, period: str | None = None, interval: str = "1d"
+) -> pd.DataFrame:
+    """Thread-safe replacement for yf.download(...)["Close"].
+
+    Fetches every ticker concurrently and returns one column per ticker,
+    all-NaN for tickers that failed, or an empty frame if all of them did.
+    """
+    with ThreadPoolExecutor(max_workers=min(len(tickers), MAX_FETCH_WORKERS)) as ex:
+        closes = list(ex.map(
+            lambda t: _ticker_close(t, start=start, period=period, interval=interval), tickers
+        ))
+    fetched = [c for c in closes if not c.empty]
+    if not fetched:
+        return pd.DataFrame()
+    return pd.concat(fetched, axis=1, sort=True).reindex(columns=list(tickers))
 
-@st.cache_data(ttl=300, show_spinner="Fetching market data...")
+
+@st.cache_data(ttl=300, show_spinner=False)
 def fetch_price_data(
     tickers: tuple[str, ...], start_date: str
 ) -> tuple[pd.DataFrame, datetime]:
@@ -21,36 +100,54 @@ def fetch_price_data(
     ticker columns. Uses auto_adjust so 'Close' is already adjusted.
     Used for correlations which need 60+ trading days of daily data.
     """
-    raw = yf.download(
-        list(tickers),
-        start=start_date,
-        auto_adjust=True,
-        threads=True,
-        progress=False,
-    )
+    close_df = _download_close(tickers, start=start_date)
 
-    if raw.empty:
+    if close_df.empty:
         return pd.DataFrame(), datetime.now(ZoneInfo("America/New_York"))
 
-    # yfinance returns flat columns for a single ticker, MultiIndex for multiple
-    if len(tickers) == 1:
-        close_df = raw[["Close"]].rename(columns={"Close": tickers[0]})
-    else:
-        close_df = raw["Close"]
+    # Retry tickers that came back all-NaN (Yahoo occasionally drops a symbol).
+    # Retries run concurrently so K failures cost one round-trip, not K.
+    failed = [t for t in tickers if close_df[t].isna().all()]
+    if failed:
+        retried = _download_close(tuple(failed), start=start_date)
+        for t in retried.columns:
+            close_df[t] = retried[t]
+
+    # float32 is plenty for prices and halves what's cached and sent to charts
+    return close_df.astype(PRICE_DTYPE), datetime.now(ZoneInfo("America/New_York"))
 
-    # Retry tickers that came back all-NaN (yfinance bulk download can fail silently)
-    failed = [t for t in tickers if t in close_df.columns and close_df[t].isna().all()]
-    for t in failed:
-        single = yf.download(
-            t, start=start_date, auto_adjust=True, progress=False
-        )
-        if not single.empty:
-            close_df[t] = single["Close"]
 
-    return close_df, datetime.now(ZoneInfo("America/New_York"))
+@st.cache_resource(ttl=900, show_spinner=False)
+def _load_parquet_history(
+    tickers: tuple[str, ...], start_date: str
+) -> pd.DataFrame | None:
+    """Load stored hourly history for tickers from start_date onward.
+
+    Only the requested columns and the row groups on/after start_date are
+    read from disk. cache_resource hands every session the same object
+    instead of an unpickled copy, so callers must treat the result as
+    read-only. The TTL lets parquet updates from the GitHub Action get
+    picked up.
+    """
+    if not PARQUET_PATH.exists():
+        return None
+    schema = pq.read_schema(PARQUET_PATH)
+    available = [t for t in tickers if t in schema.names]
+    if not available:
+        return None
+    index_col = schema.pandas_metadata["index_columns"][0]
+    stored = pd.read_parquet(
+        PARQUET_PATH,
+        engine="pyarrow",
+        columns=available,
+        filters=[(index_col, ">=", pd.Timestamp(start_date))],
+    )
+    if stored.index.tz is not None:
+        stored.index = stored.index.tz_localize(None)
+    return stored
 
 
-@st.cache_data(ttl=300, show_spinner="Fetching hourly data...")
+@st.cache_data(ttl=300, show_spinner=False)
 def fetch_hourly_data(
     tickers: tuple[str, ...], start_date: str
 ) -> tuple[pd.DataFrame, datetime]:
@@ -58,50 +155,39 @@ def fetch_hourly_data(
 
     The parquet file provides full YTD history (accumulated by GitHub Action).
     Fresh yfinance call provides the most recent hours. Overlap of 5 days
-    ensures no gaps; duplicates are dropped keeping the freshest value.
+    ensures no gaps; on overlapping hours the freshest value wins.
 
     Returns (hourly_df, fetch_timestamp).
     """
-    frames: list[pd.DataFrame] = []
-
-    # Load stored parquet history
-    if PARQUET_PATH.exists():
-        stored = pd.read_parquet(PARQUET_PATH)
-        if stored.index.tz is not None:
-            stored.index = stored.index.tz_localize(None)
-        # Filter to only requested tickers (columns that exist)
-        available = [t for t in tickers if t in stored.columns]
-        if available:
-            frames.append(stored[available])
-
-    # Fetch recent hourly from yfinance (last 5 days for overlap)
-    raw = yf.download(
-        list(tickers),
-        period="5d",
-        interval="1h",
-        auto_adjust=True,
-        threads=True,
-        progress=False,
-    )
-    if not raw.empty:
-        if len(tickers) == 1:
-            fresh = raw[["Close"]].rename(columns={"Close": tickers[0]})
-        else:
-            fresh = raw["Close"]
-        fresh.index = pd.to_datetime(fresh.index)
-        if fresh.index.tz is not None:
-            fresh.index = fresh.index.tz_localize(None)
-        frames.append(fresh)
-
-    if not frames:
+    # Load stored parquet history on a worker thread while the network
+    # request below is in flight; the two are independent.
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        f_stored = ex.submit(_load_parquet_history, tickers, start_date)
+
+        # Fetch recent hourly from yfinance (last 5 days for overlap)
+        fresh = _download_close(tickers, period="5d", interval="1h")
+        history = f_stored.result()
+
+    if fresh.empty:
+        fresh = None
+    else:
+        fresh.index = fresh.index.tz_localize(None)
+
+    if history is None and fresh is None:
         return pd.DataFrame(), datetime.now(ZoneInfo("America/New_York"))
 
-    combined = pd.concat(frames)
-    combined = combined[~combined.index.duplicated(keep="last")]
-    combined = combined.sort_index()
+    if history is None:
+        combined = fresh
+    elif fresh is None:
+        combined = history
+    else:
+        # Fresh values win on overlapping hours; stored history fills the rest
+        combined = fresh.combine_first(history)
+    if not combined.index.is_monotonic_increasing:
+        combined = combined.sort_index()
 
     # Filter to start_date onward
-    combined = combined[combined.index >= pd.Timestamp(start_date)]
+    combined = combined.loc[pd.Timestamp(start_date):].astype(PRICE_DTYPE)
 
     return combined, datetime.now(ZoneInfo("America/New_York"))
 
@@ -112,12 +198,11 @@ def get_base_prices(close_df: pd.DataFrame, base_date: date) -> pd.Series:
     Handles weekends/holidays by looking backward up to 10 days.
     """
     target = pd.Timestamp(base_date)
-    # Look backward for the most recent trading day on or before base_date
-    mask = close_df.index <= target
-    if not mask.any():
+    # Binary search for the most recent trading day on or before base_date
+    pos = close_df.index.searchsorted(target, side="right") - 1
+    if pos < 0:
         return pd.Series(dtype=float)
-    last_valid_date = close_df.index[mask][-1]
-    return close_df.loc[last_valid_date]
+    return close_df.iloc[pos]
 
 
 def get_data_start_date(base_date: date, correlation_window: int = 60) -> str:
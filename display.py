@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import altair as alt
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+CHART_CACHE_SIZE = 16
+CHART_MAX_POINTS = 2000  # per line; roughly the pixel width of a wide chart
 CHART_COLORS = ["#5B9BD5", "#E06C75", "#98C379", "#D19A66", "#C678DD", "#56B6C2", "#ABB2BF"]
 
 
@@ -19,57 +22,32 @@ def _fmt_pct(v: float) -> str:
     return f"{v:+.2%}"
 
 
-def _fmt_corr(v: float) -> str:
-    if pd.isna(v):
-        return "N/A"
-    return f"{v:.3f}"
-
-
-def _color_return(v: str) -> str:
-    if v == "N/A":
-        return ""
-    try:
-        num = float(v.replace("%", "").replace("+", "")) / 100
-    except (ValueError, AttributeError):
-        return ""
-    if num > 0:
-        return "background-color: #d4edda"
-    elif num < 0:
-        return "background-color: #f8d7da"
-    return ""
-
-
-def _color_relative(v: str) -> str:
-    if v == "N/A":
-        return ""
-    try:
-        num = float(v.replace("%", "").replace("+", "")) / 100
-    except (ValueError, AttributeError):
-        return ""
-    if num > 0:
-        return "background-color: #28a745; color: white; font-weight: bold"
-    elif num < 0:
-        return "background-color: #dc3545; color: white; font-weight: bold"
-    return ""
-
-
-def _color_corr(v: str) -> str:
-    if v == "N/A":
-        return ""
-    try:
-        num = float(v)
-    except (ValueError, AttributeError):
-        return ""
-    if num >= 0.7:
-        return "background-color: #28a745; color: white"
-    elif num >= 0.3:
-        return "background-color: #d4edda"
-    elif num >= -0.3:
-        return ""
-    elif num >= -0.7:
-        return "background-color: #f8d7da"
-    else:
-        return "background-color: #dc3545; color: white"
+def _color_return(col: pd.Series) -> np.ndarray:
+    return np.where(
+        col > 0, "background-color: #d4edda",
+        np.where(col < 0, "background-color: #f8d7da", ""),
+    )
+
+
+def _color_relative(col: pd.Series) -> np.ndarray:
+    return np.where(
+        col > 0, "background-color: #28a745; color: white; font-weight: bold",
+        np.where(col < 0, "background-color: #dc3545; color: white; font-weight: bold", ""),
+    )
+
+
+def _color_corr(col: pd.Series) -> np.ndarray:
+    return np.select(
+        [col.isna(), col >= 0.7, col >= 0.3, col >= -0.3, col >= -0.7],
+        [
+            "",
+            "background-color: #28a745; color: white",
+            "background-color: #d4edda",
+            "",
+            "background-color: #f8d7da",
+        ],
+        default="background-color: #dc3545; color: white",
+    )
 
 
 def _section_header(title: str) -> None:
@@ -87,23 +65,28 @@ def render_benchmark_header(
     current_prices: pd.Series,
     ytd_returns: pd.Series,
 ) -> None:
+    base = base_prices.get(benchmark)
+    current = current_prices.get(benchmark)
+    ret = ytd_returns.get(benchmark)
+
+    # One markdown payload for the label and all three cards instead of
+    # st.columns + three st.metric elements; styles live in app.CUSTOM_CSS
+    cards = "".join(
+        f'<div class="metric-card"><div class="metric-label">{label}</div>'
+        f'<div class="metric-value">{value}</div></div>'
+        for label, value in (
+            ("YTD Start Price", _fmt_price(base)),
+            ("Current Price", _fmt_price(current)),
+            ("YTD Return", _fmt_pct(ret)),
+        )
+    )
     st.markdown(
         f'<p style="color: #656D76; font-size: 0.9rem; margin-bottom: 0.25rem; '
         f'text-transform: uppercase; letter-spacing: 0.05em;">Benchmark</p>'
-        f'<p style="font-size: 1.4rem; font-weight: 600; margin-top: 0;">{benchmark}</p>',
+        f'<p style="font-size: 1.4rem; font-weight: 600; margin-top: 0;">{benchmark}</p>'
+        f'<div class="metric-row">{cards}</div>',
         unsafe_allow_html=True,
     )
-    col1, col2, col3 = st.columns(3)
-    base = base_prices.get(benchmark)
-    current = current_prices.get(benchmark)
-    ret = ytd_returns.get(benchmark)
-
-    with col1:
-        st.metric("YTD Start Price", _fmt_price(base))
-    with col2:
-        st.metric("Current Price", _fmt_price(current))
-    with col3:
-        st.metric("YTD Return", _fmt_pct(ret))
 
 
 def render_dat_table(
@@ -118,44 +101,47 @@ def render_dat_table(
 ) -> None:
     _section_header("DAT Company Performance")
 
-    # Index correlation data by ticker for easy lookup
-    corr_lookup = {}
-    if not corr_df.empty:
-        corr_lookup = corr_df.set_index("Ticker").to_dict("index")
-
     pearson_col = f"{correlation_window}d Corr w/ {benchmark}"
 
-    rows = []
-    for t in tickers:
-        corr_row = corr_lookup.get(t, {})
-        rows.append({
-            "Ticker": t,
-            "YTD Start Price": _fmt_price(base_prices.get(t)),
-            "Current Price": _fmt_price(current_prices.get(t)),
-            "YTD Return": _fmt_pct(ytd_returns.get(t)),
-            "Relative Return": _fmt_pct(relative_returns.get(t)),
-            pearson_col: _fmt_corr(corr_row.get("Pearson Correlation")),
-        })
-
-    df = pd.DataFrame(rows)
-
-    # Sort by relative return (best to worst), handling N/A
-    def _sort_key(val: str) -> float:
-        if val == "N/A":
-            return float("-inf")
-        try:
-            return float(val.replace("%", "").replace("+", ""))
-        except (ValueError, AttributeError):
-            return float("-inf")
-
-    df["_sort"] = df["Relative Return"].map(_sort_key)
-    df = df.sort_values("_sort", ascending=False).drop(columns="_sort").reset_index(drop=True)
+    # Align each series to the ticker order in one reindex per column
+    df = pd.DataFrame({
+        "Ticker": tickers,
+        "YTD Start Price": base_prices.reindex(tickers).to_numpy(dtype=float),
+        "Current Price": current_prices.reindex(tickers).to_numpy(dtype=float),
+        "YTD Return": ytd_returns.reindex(tickers).to_numpy(dtype=float),
+        "Relative Return": relative_returns.reindex(tickers).to_numpy(dtype=float),
+    })
+
+    # Join correlations by ticker; tickers without one get NaN
+    if corr_df.empty:
+        df[pearson_col] = np.nan
+    else:
+        df = df.merge(
+            corr_df[["Ticker", "Pearson Correlation"]].rename(
+                columns={"Pearson Correlation": pearson_col}
+            ),
+            on="Ticker",
+            how="left",
+        ).astype({pearson_col: float})
+
+    # Sort by relative return (best to worst), N/A last
+    df = df.sort_values("Relative Return", ascending=False, na_position="last").reset_index(drop=True)
 
     styled = (
         df.style
-        .map(_color_return, subset=["YTD Return"])
-        .map(_color_relative, subset=["Relative Return"])
-        .map(_color_corr, subset=[pearson_col])
+        .format(
+            {
+                "YTD Start Price": "${:.2f}",
+                "Current Price": "${:.2f}",
+                "YTD Return": "{:+.2%}",
+                "Relative Return": "{:+.2%}",
+                pearson_col: "{:.3f}",
+            },
+            na_rep="N/A",
+        )
+        .apply(_color_return, subset=["YTD Return"])
+        .apply(_color_relative, subset=["Relative Return"])
+        .apply(_color_corr, subset=[pearson_col])
         .hide(axis="index")
     )
 
@@ -171,15 +157,15 @@ def render_price_chart(
 ) -> None:
     _section_header("YTD Price")
 
-    # Filter to YTD only
-    ytd_df = close_df[close_df.index >= base_date].copy()
+    # Filter to YTD only: binary search on the sorted index, no mask or copy
+    ytd_df = close_df.iloc[close_df.index.searchsorted(base_date):]
     if ytd_df.empty:
         st.info("No YTD data available for charting.")
         return
 
     # Clean index for Vega-Lite compatibility
-    ytd_df.index = pd.to_datetime(ytd_df.index)
-    ytd_df.index.name = "Date"
+    # (rename returns a new Index rather than mutating one shared with close_df)
+    ytd_df.index = pd.to_datetime(ytd_df.index).rename("Date")
 
     # Reserve space for the chart, render controls below it
     chart_slot = st.container()
@@ -202,17 +188,37 @@ def render_price_chart(
         key=f"radio_{key}",
     )
 
-    plot_df = ytd_df[list(selected)].ffill()
-    if mode == "YTD Return (%)":
-        first_valid = plot_df.bfill().iloc[0]
-        plot_df = (plot_df / first_valid - 1) * 100
-        value_name = "Return (%)"
-    else:
-        value_name = "Price ($)"
+    value_name = "Return (%)" if mode == "YTD Return (%)" else "Price ($)"
 
-    chart_data = plot_df.reset_index().melt(
-        id_vars="Date", var_name="Ticker", value_name=value_name
+    # Memoize the melted data per session so flipping back to a previous
+    # selection/mode is a lookup. Row count + last timestamp catch new bars;
+    # the last row's values catch Yahoo revising the in-progress bar and a
+    # previously failed ticker filling in on refetch.
+    chart_cache = st.session_state.setdefault(f"chart_cache_{key}", {})
+    cache_key = (
+        tuple(selected), mode, len(ytd_df), ytd_df.index[-1], ytd_df.iloc[-1].to_numpy().tobytes()
     )
+    chart_data = chart_cache.get(cache_key)
+    if chart_data is None:
+        plot_df = ytd_df[list(selected)]
+        if plot_df.isna().any().any():
+            plot_df = plot_df.ffill()
+        if mode == "YTD Return (%)":
+            first_valid = plot_df.bfill().iloc[0]
+            plot_df = (plot_df / first_valid - 1) * 100
+        # A full year of hourly bars is more points than the chart has pixels;
+        # keep the last bar in each bucket of the finest whole-hour step under
+        # the cap. Rows keep their own timestamps, so the live price doesn't move.
+        if len(plot_df) > CHART_MAX_POINTS:
+            step = ((plot_df.index[-1] - plot_df.index[0]) / CHART_MAX_POINTS).ceil("h")
+            plot_df = plot_df[~plot_df.index.floor(step).duplicated(keep="last")]
+
+        chart_data = plot_df.reset_index().melt(
+            id_vars="Date", var_name="Ticker", value_name=value_name
+        )
+        if len(chart_cache) >= CHART_CACHE_SIZE:
+            chart_cache.clear()
+        chart_cache[cache_key] = chart_data
 
     chart = (
         alt.Chart(chart_data)